@@ -1,42 +1,83 @@
+import functools
 import math
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 # ---------------------------------------------------------
-# Utility functions
+# Sidebar defaults (initial widget values)
 # ---------------------------------------------------------
 
-def round_up_to_4_dec(x: float) -> float:
-    """Mimic Excel ROUNDUP(...,4) behaviour."""
-    if x is None:
-        return None
-    factor = 10_000
-    return math.ceil(x * factor) / factor
+_DEFAULTS = {
+    "load_mw": 0.99,
+    "discharge_h": 8.0,
+    "dod_percent": 90.0,
+    "rte_percent": 88.65,
+    "other_eff_percent": 100.0,
+    "c_rate": 0.25,
+    "grid_charging_mw": 0.5,
+    "other_charging_mw": 1.0,
+    "voltage_kv": 0.4,
+    "power_factor": 0.85,
+    "cycles_per_day": 1.0,
+}
 
+# ---------------------------------------------------------
+# Battery models (from original Excel sheet)
+# ---------------------------------------------------------
 
-def select_pcs_rating(container_power_mw: float) -> float:
-    """
-    Approximate the PCS selection logic from the Excel:
-    choose the smallest rating >= required power.
-    Available PCS sizes (MW): 1.25, 1.5, 1.75, 2, 2.5, 5
-    """
-    pcs_sizes = [1.25, 1.50, 1.75, 2.0, 2.5, 5.0]
-    for s in pcs_sizes:
-        if container_power_mw <= s:
-            return s
-    return pcs_sizes[-1]
+_BATTERY_NAMES = ("261 kWh battery", "3727.36 kWh battery", "5015.9 kWh battery")
+_BATTERY_CAPS_KWH = np.array([261.0, 3727.36, 5015.9])
+_BATTERY_CAPS_KWH.flags.writeable = False  # viewed by the results table, never mutate
 
+# Capacities as integers in 0.01 kWh steps, for exact ceiling division
+_BATTERY_CAPS_CKWH = np.rint(_BATTERY_CAPS_KWH * 100.0).astype(np.int64)
+_INT64_MAX = np.iinfo(np.int64).max
 
-def select_transformer_mva(container_power_mw: float) -> str:
-    """
-    Approximate transformer MVA selection similar to Excel I53/I55:
-    smallest MVA >= container power.
-    """
-    candidates = [1.25, 1.5, 1.75, 2.0, 2.5, 3.5, 5.0]
-    for c in candidates:
-        if container_power_mw <= c:
-            return f"{c:.2f}MVA".rstrip("0").rstrip(".") + "MVA"
-    return f"{candidates[-1]:.2f}MVA".rstrip("0").rstrip(".") + "MVA"
+# ---------------------------------------------------------
+# Equipment ratings (sorted ascending)
+# ---------------------------------------------------------
+
+_PCS_SIZES_MW = np.array([1.25, 1.50, 1.75, 2.0, 2.5, 5.0])
+_XFMR_SIZES_MVA = np.array([1.25, 1.5, 1.75, 2.0, 2.5, 3.5, 5.0])
+_XFMR_STRS = ("1.25MVA", "1.5MVA", "1.75MVA", "2MVA", "2.5MVA", "3.5MVA", "5MVA")
+
+# ---------------------------------------------------------
+# Electrical constants
+# ---------------------------------------------------------
+
+# Three-phase line current: I = P[MW] * 1e6 / (sqrt(3) * V[kV] * 1e3 * PF)
+_CURRENT_COEF = 1_000_000.0 / (math.sqrt(3.0) * 1000.0)
+_BREAKER_COEF = _CURRENT_COEF * 1.25  # apply 125% NEC factor like I59
+
+# Ampacity of one 300 mm² cable run per phase
+_CABLE_300MM_LIMIT_A = 446.0
+
+# ---------------------------------------------------------
+# Display formats for the numeric columns of the options table
+# ---------------------------------------------------------
+
+_BESS_TABLE_FORMATS = {
+    "Unit capacity (kWh)": "{:,.2f}",
+    "Number of units": "{:,.0f}",
+    "Total installed capacity (MWh)": "{:,.4f}",
+    "Oversizing vs required (MWh)": "{:,.4f}",
+    "Oversizing (%)": "{:,.2f}",
+    "Container C-rate (C)": "{:,.2f}",
+    "Approx. PCS rating per unit (MW)": "{:,.2f}",
+    "PCS quantity (for discharge power)": "{:,.0f}",
+}
+
+# ---------------------------------------------------------
+# Utility functions
+# ---------------------------------------------------------
+
+@functools.lru_cache(maxsize=32)
+def _cable_str(runs: int) -> str:
+    """Cable remark for a given number of 300 mm² runs per phase."""
+    if runs == 1:
+        return "Use 300mm² cable, 1 run per phase"
+    return f"Use 300mm² cable, {runs} runs per phase"
 
 
 def cable_runs_300mm(current_amps: float) -> str:
@@ -47,11 +88,166 @@ def cable_runs_300mm(current_amps: float) -> str:
     """
     if current_amps <= 0:
         return "No current"
-    limit_per_run = 446.0
-    runs = math.ceil(current_amps / limit_per_run)
-    if runs == 1:
-        return "Use 300mm² cable, 1 run per phase"
-    return f"Use 300mm² cable, {runs} runs per phase"
+    return _cable_str(math.ceil(current_amps / _CABLE_300MM_LIMIT_A))
+
+
+def _metrics_table(metrics) -> str:
+    """Markdown table for (label, formatted value) pairs, shown in one call."""
+    lines = ["| Metric | Value |", "| --- | ---: |"]
+    lines += [f"| {label} | **{value}** |" for label, value in metrics]
+    return "\n".join(lines)
+
+
+def _qual_block(app: str, env: str, cool: str, cyc: float, bs: str) -> str:
+    """Markdown block for the qualitative project info."""
+    return (
+        "**Qualitative info:**\n\n"
+        f"- Application: {app}\n"
+        f"- Environment: {env}\n"
+        f"- Cooling: {cool}\n"
+        f"- Cycles per day: {cyc}\n"
+        f"- Black start capability: {bs}"
+    )
+
+
+def format_bess_table(df_bess: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a copy of the options table with the numeric columns
+    pre-rendered as strings, so it can be shown without a Styler.
+    """
+    df_display = df_bess.copy()
+    for col, fmt in _BESS_TABLE_FORMATS.items():
+        df_display[col] = [fmt.format(x) for x in df_bess[col]]
+    return df_display
+
+
+# ---------------------------------------------------------
+# Core BESS sizing (mimicking Excel logic)
+# ---------------------------------------------------------
+
+@st.cache_data(max_entries=128)
+def compute_sizing(
+    load_mw: float,
+    discharge_h: float,
+    dod_percent: float,
+    rte_percent: float,
+    other_eff_percent: float,
+    c_rate: float,
+    grid_charging_mw: float,
+    other_charging_mw: float,
+    voltage_kv: float,
+    power_factor: float,
+):
+    """
+    Run the full sizing calculation for the numeric inputs.
+    Cached so reruns triggered by the qualitative widgets are free.
+    """
+    # Step 1 – Required capacity
+    initial_mwh = load_mw * discharge_h  # I19 = E19*E20
+
+    dod = dod_percent / 100.0
+    rte = rte_percent / 100.0
+    other_eff = other_eff_percent / 100.0
+
+    # Excel ROUNDUP(...,4) applied after each efficiency step
+    after_dod_mwh = math.ceil(initial_mwh / dod * 10_000.0) / 10_000.0  # I20
+    after_rte_mwh = math.ceil(after_dod_mwh / rte * 10_000.0) / 10_000.0  # I21
+    after_other_eff_mwh = math.ceil(after_rte_mwh / other_eff * 10_000.0) / 10_000.0  # I22
+
+    required_bess_mwh = after_other_eff_mwh  # I27 ~ I22 (simplified: no E5/E4 special case)
+    required_discharge_power_mw = load_mw  # I25 = E19
+    customer_c_rate = c_rate               # I26 = E28
+    charging_power_mw = round(grid_charging_mw + other_charging_mw, 2)  # I32
+
+    # Battery options – all models evaluated at once, one array per column
+    caps = _BATTERY_CAPS_KWH
+
+    # Required capacity is rounded to 4 decimals (0.1 kWh), so it is exact in 0.01 kWh
+    required_ckwh = round(required_bess_mwh * 100_000.0) if required_bess_mwh > 0 else 0
+
+    if 0 < required_ckwh <= _INT64_MAX:
+        units = -(-required_ckwh // _BATTERY_CAPS_CKWH)
+    elif required_ckwh > _INT64_MAX:
+        # Beyond int64 the exact path would overflow; float ceil is plenty at this scale
+        units = np.ceil(required_bess_mwh * 1000.0 / caps)
+    else:
+        units = np.zeros(len(caps), dtype=np.int64)
+
+    total_mwh = units * caps / 1000.0
+    oversize_mwh = total_mwh - required_bess_mwh
+    if required_bess_mwh > 0:
+        oversize_pct = oversize_mwh / required_bess_mwh * 100.0
+    else:
+        oversize_pct = np.zeros(len(caps))
+
+    # PCS sizing per unit – similar idea to I36/I41/I38/I43:
+    # smallest rating >= container power, capped at the largest
+    container_power_mw = customer_c_rate * caps / 1000.0
+    pcs_idx = np.minimum(np.searchsorted(_PCS_SIZES_MW, container_power_mw), len(_PCS_SIZES_MW) - 1)
+    pcs_rating_mw = _PCS_SIZES_MW[pcs_idx]
+    pcs_quantity = np.ceil(required_discharge_power_mw / pcs_rating_mw).astype(np.int64)
+
+    # Transformer sizing – similar idea to I53/I55: smallest MVA >= container power
+    xfmr_idx = np.minimum(np.searchsorted(_XFMR_SIZES_MVA, container_power_mw), len(_XFMR_SIZES_MVA) - 1)
+    transformer_mva = [_XFMR_STRS[i] for i in xfmr_idx]
+
+    # Numeric table, only kept long enough to build the display frame
+    df_bess = pd.DataFrame({
+        "Battery model": _BATTERY_NAMES,
+        "Unit capacity (kWh)": caps,
+        "Number of units": units,
+        "Total installed capacity (MWh)": total_mwh,
+        "Oversizing vs required (MWh)": oversize_mwh,
+        "Oversizing (%)": oversize_pct,
+        "Container C-rate (C)": customer_c_rate,
+        "Approx. PCS rating per unit (MW)": pcs_rating_mw,
+        "PCS quantity (for discharge power)": pcs_quantity,
+        "Transformer per unit (approx)": transformer_mva,
+    }, copy=False)
+    df_display = format_bess_table(df_bess)
+
+    # Identify "best" model by smallest oversizing
+    best_idx = int(np.clip(oversize_mwh, 0.0, None).argmin()) if required_bess_mwh > 0 else None
+
+    # Suggested configuration, read straight from the arrays
+    best_config = None
+    if best_idx is not None:
+        best_config = (
+            f"- **Battery model:** {_BATTERY_NAMES[best_idx]}  \n"
+            f"- **Number of units:** {int(units[best_idx])}  \n"
+            f"- **Total installed capacity:** {total_mwh[best_idx]:.4f} MWh  \n"
+            f"- **Oversizing:** {oversize_mwh[best_idx]:.4f} MWh "
+            f"({oversize_pct[best_idx]:.2f}%)  \n"
+            f"- **PCS per unit:** ~{pcs_rating_mw[best_idx]:.2f} MW  \n"
+            f"- **PCS quantity:** {int(pcs_quantity[best_idx])}  \n"
+            f"- **Transformer per unit:** {transformer_mva[best_idx]}"
+        )
+
+    # Electrical – main breaker and cable
+
+    if voltage_kv > 0 and power_factor > 0:
+        inv = 1.0 / (voltage_kv * power_factor)
+        current_amps = required_discharge_power_mw * _CURRENT_COEF * inv
+        breaker_amps = required_discharge_power_mw * _BREAKER_COEF * inv
+    else:
+        current_amps = 0.0
+        breaker_amps = 0.0
+
+    cable_recommendation = cable_runs_300mm(current_amps)
+
+    return (
+        initial_mwh,
+        after_dod_mwh,
+        after_rte_mwh,
+        after_other_eff_mwh,
+        required_bess_mwh,
+        charging_power_mw,
+        df_display,
+        best_config,
+        current_amps,
+        breaker_amps,
+        cable_recommendation,
+    )
 
 
 # ---------------------------------------------------------
@@ -66,20 +262,20 @@ st.set_page_config(
 st.title("BESS Sizing Calculator (Web Version)")
 st.caption("Converted from 'BESS Sizing Calculator (R2.1)' Excel sheet")
 
-with st.sidebar:
+with st.sidebar.form("bess_inputs", clear_on_submit=False):
     st.subheader("Site Load Requirements")
 
     load_mw = st.number_input(
         "Customer load supported by BESS (MW)",
         min_value=0.0,
-        value=0.99,
+        value=_DEFAULTS["load_mw"],
         step=0.01
     )
 
     discharge_h = st.number_input(
         "Discharge duration (hours)",
         min_value=0.0,
-        value=8.0,
+        value=_DEFAULTS["discharge_h"],
         step=0.5
     )
 
@@ -87,7 +283,7 @@ with st.sidebar:
         "Depth of Discharge, DoD (%)",
         min_value=1.0,
         max_value=100.0,
-        value=90.0,
+        value=_DEFAULTS["dod_percent"],
         step=1.0
     )
 
@@ -95,7 +291,7 @@ with st.sidebar:
         "Round-trip efficiency, RTE (%)",
         min_value=1.0,
         max_value=100.0,
-        value=88.65,
+        value=_DEFAULTS["rte_percent"],
         step=0.1
     )
 
@@ -103,7 +299,7 @@ with st.sidebar:
         "Other efficiency (%)",
         min_value=1.0,
         max_value=100.0,
-        value=100.0,
+        value=_DEFAULTS["other_eff_percent"],
         step=0.1
     )
 
@@ -114,21 +310,21 @@ with st.sidebar:
         "Customer C-rate (max 0.5C)",
         min_value=0.01,
         max_value=1.0,
-        value=0.25,
+        value=_DEFAULTS["c_rate"],
         step=0.01
     )
 
     grid_charging_mw = st.number_input(
         "Power available for charging – grid (MW)",
         min_value=0.0,
-        value=0.5,
+        value=_DEFAULTS["grid_charging_mw"],
         step=0.1
     )
 
     other_charging_mw = st.number_input(
         "Power available for charging – other (MW)",
         min_value=0.0,
-        value=1.0,
+        value=_DEFAULTS["other_charging_mw"],
         step=0.1
     )
 
@@ -138,7 +334,7 @@ with st.sidebar:
     voltage_kv = st.number_input(
         "Voltage standard (kV)",
         min_value=0.1,
-        value=0.4,
+        value=_DEFAULTS["voltage_kv"],
         step=0.01
     )
 
@@ -146,7 +342,7 @@ with st.sidebar:
         "Power factor",
         min_value=0.1,
         max_value=1.0,
-        value=0.85,
+        value=_DEFAULTS["power_factor"],
         step=0.01
     )
 
@@ -180,7 +376,7 @@ with st.sidebar:
     cycles_per_day = st.number_input(
         "Charge/discharge cycles per day",
         min_value=0.0,
-        value=1.0,
+        value=_DEFAULTS["cycles_per_day"],
         step=0.5
     )
 
@@ -190,90 +386,41 @@ with st.sidebar:
         index=0
     )
 
-# ---------------------------------------------------------
-# Core BESS sizing (mimicking Excel logic)
-# ---------------------------------------------------------
-
-# Step 1 – Required capacity
-initial_mwh = load_mw * discharge_h  # I19 = E19*E20
-
-after_dod_mwh = round_up_to_4_dec(initial_mwh / (dod_percent / 100.0))  # I20
-after_rte_mwh = round_up_to_4_dec(after_dod_mwh / (rte_percent / 100.0))  # I21
-after_other_eff_mwh = round_up_to_4_dec(after_rte_mwh / (other_eff_percent / 100.0))  # I22
-
-required_bess_mwh = after_other_eff_mwh  # I27 ~ I22 (simplified: no E5/E4 special case)
-required_discharge_power_mw = load_mw  # I25 = E19
-customer_c_rate = c_rate               # I26 = E28
-charging_power_mw = round(grid_charging_mw + other_charging_mw, 2)  # I32
+    submitted = st.form_submit_button("Recalculate")
 
 # ---------------------------------------------------------
-# Battery models (from original Excel sheet)
+# Core BESS sizing
 # ---------------------------------------------------------
 
-battery_models = [
-    {"name": "261 kWh battery", "capacity_kwh": 261.0},
-    {"name": "3727.36 kWh battery", "capacity_kwh": 3727.36},
-    {"name": "5015.9 kWh battery", "capacity_kwh": 5015.9},
-]
-
-rows = []
-
-for model in battery_models:
-    cap_kwh = model["capacity_kwh"]
-
-    if required_bess_mwh > 0:
-        units = math.ceil(required_bess_mwh * 1000.0 / cap_kwh)
-    else:
-        units = 0
-
-    total_mwh = units * cap_kwh / 1000.0
-    oversize_mwh = total_mwh - required_bess_mwh if required_bess_mwh is not None else None
-    oversize_pct = (
-        (oversize_mwh / required_bess_mwh * 100.0)
-        if required_bess_mwh and required_bess_mwh > 0
-        else 0.0
+# Inputs are batched in the sidebar form, so only recompute on submit
+if submitted or "bess_results" not in st.session_state:
+    st.session_state["bess_results"] = compute_sizing(
+        load_mw,
+        discharge_h,
+        dod_percent,
+        rte_percent,
+        other_eff_percent,
+        c_rate,
+        grid_charging_mw,
+        other_charging_mw,
+        voltage_kv,
+        power_factor,
     )
 
-    # PCS sizing per unit – similar idea to I36/I41/I38/I43
-    container_power_mw = customer_c_rate * cap_kwh / 1000.0
-    pcs_rating_mw = select_pcs_rating(container_power_mw)
-    pcs_quantity = math.ceil(required_discharge_power_mw / pcs_rating_mw) if pcs_rating_mw > 0 else 0
-
-    # Transformer sizing – similar idea to I53/I55
-    transformer_mva = select_transformer_mva(container_power_mw)
-
-    rows.append({
-        "Battery model": model["name"],
-        "Unit capacity (kWh)": cap_kwh,
-        "Number of units": units,
-        "Total installed capacity (MWh)": total_mwh,
-        "Oversizing vs required (MWh)": oversize_mwh,
-        "Oversizing (%)": oversize_pct,
-        "Container C-rate (C)": customer_c_rate,
-        "Approx. PCS rating per unit (MW)": pcs_rating_mw,
-        "PCS quantity (for discharge power)": pcs_quantity,
-        "Transformer per unit (approx)": transformer_mva,
-    })
-
-df_bess = pd.DataFrame(rows)
-
-# Identify "best" model by smallest oversizing
-best_idx = None
-if required_bess_mwh and required_bess_mwh > 0:
-    best_idx = df_bess["Oversizing vs required (MWh)"].clip(lower=0).idxmin()
-
-# ---------------------------------------------------------
-# Electrical – main breaker and cable
-# ---------------------------------------------------------
-
-if voltage_kv > 0 and power_factor > 0:
-    current_amps = required_discharge_power_mw * 1_000_000.0 / (math.sqrt(3) * voltage_kv * 1000.0 * power_factor)
-else:
-    current_amps = 0.0
-
-breaker_amps = current_amps * 1.25  # apply 125% NEC factor like I59
-
-cable_recommendation = cable_runs_300mm(current_amps)
+(
+    initial_mwh,
+    after_dod_mwh,
+    after_rte_mwh,
+    after_other_eff_mwh,
+    required_bess_mwh,
+    charging_power_mw,
+    df_display,
+    best_config,
+    current_amps,
+    breaker_amps,
+    cable_recommendation,
+) = st.session_state["bess_results"]
+required_discharge_power_mw = load_mw  # I25 = E19
 
 # ---------------------------------------------------------
 # Display results
@@ -284,64 +431,48 @@ col1, col2 = st.columns(2)
 with col1:
     st.subheader("1. Required Battery Capacity (Excel Logic)")
 
-    st.metric("Customer load (MW)", f"{load_mw:.3f}")
-    st.metric("Discharge duration (h)", f"{discharge_h:.2f}")
-    st.metric("Initial energy (MWh)", f"{initial_mwh:.4f}")
-
-    st.write("**After applying efficiencies:**")
-    st.write(f"- After DoD: **{after_dod_mwh:.4f} MWh**")
-    st.write(f"- After RTE: **{after_rte_mwh:.4f} MWh**")
-    st.write(f"- After other efficiency: **{after_other_eff_mwh:.4f} MWh**")
+    st.markdown(_metrics_table([
+        ("Customer load (MW)", f"{load_mw:.3f}"),
+        ("Discharge duration (h)", f"{discharge_h:.2f}"),
+        ("Initial energy (MWh)", f"{initial_mwh:.4f}"),
+    ]))
+
+    st.markdown(
+        "**After applying efficiencies:**\n\n"
+        f"- After DoD: **{after_dod_mwh:.4f} MWh**\n"
+        f"- After RTE: **{after_rte_mwh:.4f} MWh**\n"
+        f"- After other efficiency: **{after_other_eff_mwh:.4f} MWh**"
+    )
 
     st.markdown("---")
-    st.metric("Required BESS capacity (MWh)", f"{required_bess_mwh:.4f}")
-    st.metric("Required discharging power (MW)", f"{required_discharge_power_mw:.3f}")
-    st.metric("Charging power available (MW)", f"{charging_power_mw:.2f}")
+    st.markdown(_metrics_table([
+        ("Required BESS capacity (MWh)", f"{required_bess_mwh:.4f}"),
+        ("Required discharging power (MW)", f"{required_discharge_power_mw:.3f}"),
+        ("Charging power available (MW)", f"{charging_power_mw:.2f}"),
+    ]))
 
 with col2:
     st.subheader("2. Electrical Summary")
 
-    st.metric("System voltage (kV)", f"{voltage_kv:.3f}")
-    st.metric("Power factor", f"{power_factor:.2f}")
+    st.markdown(_metrics_table([
+        ("System voltage (kV)", f"{voltage_kv:.3f}"),
+        ("Power factor", f"{power_factor:.2f}"),
+    ]))
 
-    st.write(f"**Line current (approx.):** {current_amps:,.2f} A")
-    st.write(f"**Main breaker rating (125%):** {breaker_amps:,.2f} A")
-    st.write(f"**Cable recommendation:** {cable_recommendation}")
+    st.markdown(
+        f"**Line current (approx.):** {current_amps:,.2f} A  \n"
+        f"**Main breaker rating (125%):** {breaker_amps:,.2f} A  \n"
+        f"**Cable recommendation:** {cable_recommendation}"
+    )
 
     st.markdown("---")
-    st.write("**Qualitative info:**")
-    st.write(f"- Application: {project_application}")
-    st.write(f"- Environment: {ambient_env}")
-    st.write(f"- Cooling: {cooling}")
-    st.write(f"- Cycles per day: {cycles_per_day}")
-    st.write(f"- Black start capability: {black_start}")
+    st.markdown(_qual_block(project_application, ambient_env, cooling, cycles_per_day, black_start))
 
 st.markdown("---")
 st.subheader("3. BESS Configuration Options")
 
-st.dataframe(
-    df_bess.style.format({
-        "Unit capacity (kWh)": "{:,.2f}",
-        "Number of units": "{:,.0f}",
-        "Total installed capacity (MWh)": "{:,.4f}",
-        "Oversizing vs required (MWh)": "{:,.4f}",
-        "Oversizing (%)": "{:,.2f}",
-        "Container C-rate (C)": "{:,.2f}",
-        "Approx. PCS rating per unit (MW)": "{:,.2f}",
-        "PCS quantity (for discharge power)": "{:,.0f}",
-    })
-)
+st.dataframe(df_display)
 
-if best_idx is not None and 0 <= best_idx < len(df_bess):
-    best_row = df_bess.iloc[best_idx]
+if best_config is not None:
     st.markdown("### 4. Suggested Configuration")
-    st.write(
-        f"- **Battery model:** {best_row['Battery model']}  \n"
-        f"- **Number of units:** {int(best_row['Number of units'])}  \n"
-        f"- **Total installed capacity:** {best_row['Total installed capacity (MWh)']:.4f} MWh  \n"
-        f"- **Oversizing:** {best_row['Oversizing vs required (MWh)']:.4f} MWh "
-        f"({best_row['Oversizing (%)']:.2f}%)  \n"
-        f"- **PCS per unit:** ~{best_row['Approx. PCS rating per unit (MW)']:.2f} MW  \n"
-        f"- **PCS quantity:** {int(best_row['PCS quantity (for discharge power)'])}  \n"
-        f"- **Transformer per unit:** {best_row['Transformer per unit (approx)']}"
-    )
+    st.write(best_config)
@@ -0,0 +1,81 @@
+"""
+Batched BESS sizing for what-if sweeps (e.g. DoD x RTE x duration grids).
+
+Same Step-1 and unit-count logic as compute_sizing in app.py, over arrays
+of scenarios. numba is optional: when installed the kernel is compiled and
+parallelised over scenarios, otherwise it runs as plain Python.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba not installed – run the kernel uncompiled
+    njit = None
+    prange = range
+
+
+def _jit(fn):
+    if njit is None:
+        return fn
+    # No fastmath: it may reorder the divisions and change the ROUNDUP result
+    return njit(parallel=True, cache=True)(fn)
+
+
+# Largest 0.01 kWh count the exact integer unit count can take
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+@_jit
+def batched_sizing(load, hours, dod, rte, other, c_rate, caps):
+    """
+    Size every scenario i against every battery model j.
+
+    load, hours, dod, rte, other, c_rate: 1-D arrays of length n
+    (efficiencies in %, as in the sidebar). caps: unit capacities (kWh).
+    Returns required_mwh (n,), units (n, m), total_mwh (n, m) and
+    container_power_mw (n, m). Unit counts are whole numbers stored as
+    float, so very large scenarios cannot wrap around like int64 would.
+    """
+    n = load.shape[0]
+    m = caps.shape[0]
+    required_mwh = np.zeros(n)
+    units = np.zeros((n, m))
+    total_mwh = np.zeros((n, m))
+    container_power_mw = np.zeros((n, m))
+
+    caps_ckwh = np.empty(m, dtype=np.int64)
+    for j in range(m):
+        caps_ckwh[j] = int(round(caps[j] * 100.0))
+
+    for i in prange(n):
+        # Excel ROUNDUP(...,4) after each efficiency step (I20-I22), kept in
+        # float: math.ceil returns int64 under numba and wraps for large loads
+        mwh = load[i] * hours[i]
+        mwh = np.ceil(mwh / (dod[i] / 100.0) * 10_000.0) / 10_000.0
+        mwh = np.ceil(mwh / (rte[i] / 100.0) * 10_000.0) / 10_000.0
+        mwh = np.ceil(mwh / (other[i] / 100.0) * 10_000.0) / 10_000.0
+        required_mwh[i] = mwh
+
+        # Integer ceiling division in 0.01 kWh, as in compute_sizing;
+        # float ceil once the scaled capacity no longer fits in int64
+        scaled = mwh * 100_000.0
+        exact = scaled < _INT64_MAX
+        required_ckwh = int(round(scaled)) if exact else 0
+        for j in range(m):
+            container_power_mw[i, j] = c_rate[i] * caps[j] / 1000.0
+            if mwh <= 0:
+                continue
+            if exact:
+                units[i, j] = -(-required_ckwh // caps_ckwh[j])
+            else:
+                units[i, j] = np.ceil(mwh * 1000.0 / caps[j])
+            total_mwh[i, j] = units[i, j] * caps[j] / 1000.0
+
+    return required_mwh, units, total_mwh, container_power_mw
+
+
+if njit is not None:
+    # Pay the JIT cost at import rather than on the first sweep
+    _x = np.ones(1)
+    batched_sizing(_x, _x, _x * 90.0, _x * 90.0, _x * 100.0, _x * 0.25, np.array([261.0]))
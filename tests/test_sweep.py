@@ -0,0 +1,63 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import sweep  # noqa: E402
+
+CAPS = np.array([261.0, 3727.36, 5015.9])
+
+# Loads (MW) over 10 h whose scaled capacity sits below, near and above
+# the int64 bound used for the exact unit count
+LOADS = np.array([0.99, 1e12, 9e12, 9.2e12, 9.3e12, 1e13, 9e13, 1e14])
+
+
+def _run(kernel, load):
+    n = len(load)
+    return kernel(
+        load,
+        np.full(n, 10.0),
+        np.full(n, 90.0),
+        np.full(n, 88.65),
+        np.full(n, 100.0),
+        np.full(n, 0.25),
+        CAPS,
+    )
+
+
+def _pure_kernel():
+    # numba dispatchers keep the original Python function on .py_func
+    return getattr(sweep.batched_sizing, "py_func", sweep.batched_sizing)
+
+
+def _excel_required_mwh(load, hours, dod, rte, other):
+    mwh = load * hours
+    for eff in (dod, rte, other):
+        mwh = math.ceil(mwh / (eff / 100.0) * 10_000.0) / 10_000.0
+    return mwh
+
+
+def test_pure_python_matches_step_by_step_roundup():
+    required_mwh, units, total_mwh, _ = _run(_pure_kernel(), LOADS)
+    for i, load in enumerate(LOADS):
+        expected = _excel_required_mwh(load, 10.0, 90.0, 88.65, 100.0)
+        assert required_mwh[i] == pytest.approx(expected, rel=1e-12)
+        assert (units[i] > 0).all()
+        assert (total_mwh[i] >= required_mwh[i] * (1 - 1e-12)).all()
+
+
+def test_compiled_matches_pure_python_near_int64_bound():
+    pytest.importorskip("numba")
+    compiled = _run(sweep.batched_sizing, LOADS)
+    pure = _run(_pure_kernel(), LOADS)
+    for got, expected in zip(compiled, pure):
+        np.testing.assert_allclose(got, expected, rtol=1e-12)
+
+
+def test_container_power_reported_for_zero_load():
+    load = np.array([0.0])
+    required_mwh, units, total_mwh, container_power_mw = _run(_pure_kernel(), load)
+    assert required_mwh[0] == 0.0
+    assert (units[0] == 0).all()
+    np.testing.assert_allclose(container_power_mw[0], 0.25 * CAPS / 1000.0)